@@ -1,11 +1,13 @@
 import os
-import yaml
+import time
 from pathlib import Path
 from datetime import date, datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 import streamlit as st
-from services.databricks_jobs import DatabricksJobsService
+
+if TYPE_CHECKING:
+    from services.databricks_jobs import DatabricksJobsService
 
 # Load environment variables
 load_dotenv()
@@ -17,209 +19,391 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize services
-jobs_service = DatabricksJobsService()
+
+def get_jobs_service() -> "DatabricksJobsService":
+    """
+    Return the shared jobs service (one per process, so its WorkspaceClient is created once).
+    The Databricks SDK is only imported the first time a job is actually submitted.
+    """
+    from services.databricks_jobs import jobs_service
+    return jobs_service
+
+
+@st.cache_resource(show_spinner=False)
+def _databricks_host() -> str:
+    """Workspace URL from the environment, read once per process."""
+    return os.getenv("DATABRICKS_HOST", "").rstrip('/')
+
+
+def build_job_run_url(job_id: str, run_id: str) -> str:
+    """Construct the Databricks UI URL for a job run."""
+    return f"{_databricks_host()}/#job/{job_id}/run/{run_id}"
+
 
 # Constants
 JOB_CONFIGS_DIR = Path("job_configs")
+JOB_TIMEOUT_SECONDS = 3600
+JOB_POLL_INTERVAL_SECONDS = 2
+JOB_MAX_POLL_INTERVAL_SECONDS = 30
+FRAGMENT_REFRESH_SECONDS = 2
+
+
+def _build_render_spec(param_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute the static widget arguments for a parameter from its config."""
+    param_type = param_config.get('type', 'text')
+    label = param_config.get('label', param_config['name'])
+    required = param_config.get('required', False)
+    validation = param_config.get('validation') or {}
+    
+    widget_kwargs = {'label': f"{label}{' *' if required else ''}"}
+    fallback_value = None
+    
+    if param_type == 'text':
+        max_length = validation.get('max_length', None)
+        widget_kwargs['max_chars'] = max_length if max_length else None
+        widget_kwargs['help'] = f"Max length: {max_length}" if max_length else None
+    
+    elif param_type in ('integer', 'decimal'):
+        min_val = validation.get('min', None)
+        max_val = validation.get('max', None)
+        widget_kwargs['min_value'] = min_val
+        widget_kwargs['max_value'] = max_val
+        if param_type == 'integer':
+            widget_kwargs['step'] = 1
+            fallback_value = min_val if min_val else 0
+        else:
+            widget_kwargs['step'] = 0.01
+            widget_kwargs['format'] = "%.2f"
+            fallback_value = min_val if min_val else 0.0
+    
+    elif param_type == 'date':
+        widget_kwargs['min_value'] = validation.get('_min_date')
+        widget_kwargs['max_value'] = validation.get('_max_date')
+    
+    elif param_type == 'enum':
+        widget_kwargs['options'] = param_config.get('options', [])
+    
+    return {'widget_kwargs': widget_kwargs, 'fallback_value': fallback_value}
+
+
+def _prepare_parameters(config: Any):
+    """
+    Precompute per-parameter data once per config load: parsed min_date/max_date stored
+    alongside their strings, and a '_spec' with the static widget arguments.
+    """
+    if not isinstance(config, dict):
+        return
+    for param_config in config.get('parameters') or []:
+        validation = param_config.get('validation')
+        if param_config.get('type') == 'date' and validation:
+            for bound in ('min_date', 'max_date'):
+                if validation.get(bound):
+                    validation[f"_{bound}"] = datetime.strptime(validation[bound], '%Y-%m-%d').date()
+        param_config['_spec'] = _build_render_spec(param_config)
+
+
+def _parse_yaml(path: str) -> Any:
+    """Parse a job config YAML file and precompute its parameter data."""
+    import yaml
+    # Prefer the libyaml-backed C loader, falling back to the pure-Python one
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=loader)
+    _prepare_parameters(config)
+    return config
+
+
+@st.cache_resource(show_spinner=False)
+def _config_cache() -> Dict[str, Tuple[float, Any, Optional[str]]]:
+    """
+    Process-wide {path: (mtime, parsed config, parse error)} store. app.py is re-executed on
+    every rerun, so a plain module global would not survive; st.cache_resource keeps one dict.
+    """
+    return {}
+
+
+def _load_config_file(config_file: Path) -> Any:
+    """Return the parsed config, re-reading the file only when its mtime has changed."""
+    path = str(config_file)
+    mtime = config_file.stat().st_mtime
+    cache = _config_cache()
+    
+    cached = cache.get(path)
+    if cached is None or cached[0] != mtime:
+        try:
+            cached = (mtime, _parse_yaml(path), None)
+        except Exception as e:
+            # Remember malformed files too, so they aren't re-read until they change.
+            # Only the message is kept: re-raising one stored exception would keep growing its traceback
+            cached = (mtime, None, str(e))
+        cache[path] = cached
+    
+    if cached[2] is not None:
+        raise Exception(cached[2])
+    return cached[1]
 
 
-def load_job_configs() -> Dict[str, Path]:
-    """Load all YAML config files from job_configs directory."""
+def load_job_configs() -> Dict[str, Dict[str, Any]]:
+    """Load all YAML config files from job_configs directory, keyed by job name."""
     configs = {}
     if JOB_CONFIGS_DIR.exists():
         for config_file in JOB_CONFIGS_DIR.glob("*.yaml"):
             try:
-                with open(config_file, 'r') as f:
-                    config = yaml.safe_load(f)
-                    if config and 'job_name' in config:
-                        configs[config['job_name']] = config_file
+                config = _load_config_file(config_file)
+                if config and 'job_name' in config:
+                    configs[config['job_name']] = config
             except Exception as e:
                 st.error(f"Error loading config {config_file}: {e}")
     return configs
 
 
-def load_job_config(job_name: str) -> Optional[Dict[str, Any]]:
-    """Load a specific job config by name."""
-    configs = load_job_configs()
-    if job_name not in configs:
-        return None
-    
+def _validate_text(value: Any, param_config: Dict[str, Any], validation: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    if 'max_length' in validation:
+        if len(str(value)) > validation['max_length']:
+            return False, f"Maximum length is {validation['max_length']} characters"
+    return True, None
+
+
+def _validate_integer(value: Any, param_config: Dict[str, Any], validation: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     try:
-        with open(configs[job_name], 'r') as f:
-            return yaml.safe_load(f)
-    except Exception as e:
-        st.error(f"Error loading config for {job_name}: {e}")
-        return None
+        int_value = int(value)
+        if 'min' in validation and int_value < validation['min']:
+            return False, f"Minimum value is {validation['min']}"
+        if 'max' in validation and int_value > validation['max']:
+            return False, f"Maximum value is {validation['max']}"
+    except ValueError:
+        return False, "Must be a valid integer"
+    return True, None
 
 
-def validate_parameter(value: Any, param_config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-    """Validate a parameter value against its configuration."""
-    param_type = param_config.get('type')
-    validation = param_config.get('validation', {})
-    
-    # Check required fields
-    if param_config.get('required', False) and (value is None or value == ''):
-        return False, f"{param_config.get('label', param_config['name'])} is required"
-    
-    # Skip validation if value is empty and not required
-    if not param_config.get('required', False) and (value is None or value == ''):
-        return True, None
-    
-    # Type-specific validation
-    if param_type == 'text':
-        if 'max_length' in validation:
-            if len(str(value)) > validation['max_length']:
-                return False, f"Maximum length is {validation['max_length']} characters"
-    
-    elif param_type == 'integer':
+def _validate_decimal(value: Any, param_config: Dict[str, Any], validation: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    try:
+        float_value = float(value)
+        if 'min' in validation and float_value < validation['min']:
+            return False, f"Minimum value is {validation['min']}"
+        if 'max' in validation and float_value > validation['max']:
+            return False, f"Maximum value is {validation['max']}"
+    except ValueError:
+        return False, "Must be a valid number"
+    return True, None
+
+
+def _validate_date(value: Any, param_config: Dict[str, Any], validation: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    if isinstance(value, date):
+        date_value = value
+    elif isinstance(value, str):
         try:
-            int_value = int(value)
-            if 'min' in validation and int_value < validation['min']:
-                return False, f"Minimum value is {validation['min']}"
-            if 'max' in validation and int_value > validation['max']:
-                return False, f"Maximum value is {validation['max']}"
+            date_value = datetime.strptime(value, '%Y-%m-%d').date()
         except ValueError:
-            return False, "Must be a valid integer"
+            return False, "Must be a valid date (YYYY-MM-DD)"
+    else:
+        return False, "Must be a valid date"
     
-    elif param_type == 'decimal':
-        try:
-            float_value = float(value)
-            if 'min' in validation and float_value < validation['min']:
-                return False, f"Minimum value is {validation['min']}"
-            if 'max' in validation and float_value > validation['max']:
-                return False, f"Maximum value is {validation['max']}"
-        except ValueError:
-            return False, "Must be a valid number"
+    min_date = validation.get('_min_date')
+    if min_date and date_value < min_date:
+        return False, f"Date must be on or after {validation['min_date']}"
     
-    elif param_type == 'date':
-        if isinstance(value, date):
-            date_value = value
-        elif isinstance(value, str):
-            try:
-                date_value = datetime.strptime(value, '%Y-%m-%d').date()
-            except ValueError:
-                return False, "Must be a valid date (YYYY-MM-DD)"
-        else:
-            return False, "Must be a valid date"
-        
-        if 'min_date' in validation:
-            min_date = datetime.strptime(validation['min_date'], '%Y-%m-%d').date()
-            if date_value < min_date:
-                return False, f"Date must be on or after {validation['min_date']}"
-        
-        if 'max_date' in validation:
-            max_date = datetime.strptime(validation['max_date'], '%Y-%m-%d').date()
-            if date_value > max_date:
-                return False, f"Date must be on or before {validation['max_date']}"
+    max_date = validation.get('_max_date')
+    if max_date and date_value > max_date:
+        return False, f"Date must be on or before {validation['max_date']}"
+    return True, None
+
+
+def _validate_enum(value: Any, param_config: Dict[str, Any], validation: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    options = param_config.get('options', [])
+    if value not in options:
+        return False, f"Must be one of: {', '.join(options)}"
+    return True, None
+
+
+# Type-specific validator for each parameter type, built once at import
+_PARAMETER_VALIDATORS = {
+    'text': _validate_text,
+    'integer': _validate_integer,
+    'decimal': _validate_decimal,
+    'date': _validate_date,
+    'enum': _validate_enum,
+}
+
+
+def validate_parameter(value: Any, param_config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Validate a parameter value against its configuration."""
+    # Empty values only need the required check; skip type-specific validation for them
+    if value is None or value == '':
+        if param_config.get('required', False):
+            return False, f"{param_config.get('label', param_config['name'])} is required"
+        return True, None
     
-    elif param_type == 'enum':
-        options = param_config.get('options', [])
-        if value not in options:
-            return False, f"Must be one of: {', '.join(options)}"
+    # Type-specific validation (unknown types have no extra rules)
+    validator = _PARAMETER_VALIDATORS.get(param_config.get('type'))
+    if validator is None:
+        return True, None
+    return validator(value, param_config, param_config.get('validation', {}))
+
+
+def _render_text(spec: Dict[str, Any], key: str, default_value: Any) -> Any:
+    value = st.text_input(
+        value=default_value if default_value else "",
+        key=key,
+        **spec['widget_kwargs']
+    )
+    return value if value else None
+
+
+def _render_integer(spec: Dict[str, Any], key: str, default_value: Any) -> Any:
+    return st.number_input(
+        value=int(default_value) if default_value is not None else spec['fallback_value'],
+        key=key,
+        **spec['widget_kwargs']
+    )
+
+
+def _render_decimal(spec: Dict[str, Any], key: str, default_value: Any) -> Any:
+    return st.number_input(
+        value=float(default_value) if default_value is not None else spec['fallback_value'],
+        key=key,
+        **spec['widget_kwargs']
+    )
+
+
+def _render_date(spec: Dict[str, Any], key: str, default_value: Any) -> Any:
+    default_date = None
+    if default_value:
+        if isinstance(default_value, str):
+            default_date = datetime.strptime(default_value, '%Y-%m-%d').date()
+        elif isinstance(default_value, date):
+            default_date = default_value
     
-    return True, None
+    value = st.date_input(
+        value=default_date,
+        key=key,
+        **spec['widget_kwargs']
+    )
+    return value if value else None
+
+
+def _render_enum(spec: Dict[str, Any], key: str, default_value: Any) -> Any:
+    options = spec['widget_kwargs']['options']
+    default_index = 0
+    if default_value and default_value in options:
+        default_index = options.index(default_value)
+    
+    value = st.selectbox(
+        index=default_index,
+        key=key,
+        **spec['widget_kwargs']
+    )
+    return value if value else None
+
+
+def _render_fallback(spec: Dict[str, Any], key: str, default_value: Any) -> Any:
+    # Fallback to text input
+    return st.text_input(
+        value=default_value if default_value else "",
+        key=key,
+        **spec['widget_kwargs']
+    )
+
+
+# Widget renderer for each parameter type, built once at import
+_PARAMETER_RENDERERS = {
+    'text': _render_text,
+    'integer': _render_integer,
+    'decimal': _render_decimal,
+    'date': _render_date,
+    'enum': _render_enum,
+}
 
 
 def render_parameter_input(param_config: Dict[str, Any], key_prefix: str) -> Any:
-    """Render the appropriate input widget for a parameter."""
-    param_name = param_config['name']
-    param_type = param_config.get('type', 'text')
-    label = param_config.get('label', param_name)
-    required = param_config.get('required', False)
-    validation = param_config.get('validation', {})
-    key = f"{key_prefix}_{param_name}"
+    """Render the appropriate input widget for a parameter from its precomputed render spec."""
+    key = f"{key_prefix}_{param_config['name']}"
     
     # Get default value from session state if available
     default_value = st.session_state.get(key, None)
     
-    if param_type == 'text':
-        max_length = validation.get('max_length', None)
-        value = st.text_input(
-            label=f"{label}{' *' if required else ''}",
-            value=default_value if default_value else "",
-            key=key,
-            max_chars=max_length if max_length else None,
-            help=f"Max length: {max_length}" if max_length else None
-        )
-        return value if value else None
-    
-    elif param_type == 'integer':
-        min_val = validation.get('min', None)
-        max_val = validation.get('max', None)
-        value = st.number_input(
-            label=f"{label}{' *' if required else ''}",
-            value=int(default_value) if default_value is not None else (min_val if min_val else 0),
-            min_value=min_val if min_val is not None else None,
-            max_value=max_val if max_val is not None else None,
-            step=1,
-            key=key
-        )
-        return value if value is not None else None
+    renderer = _PARAMETER_RENDERERS.get(param_config.get('type', 'text'), _render_fallback)
+    return renderer(param_config['_spec'], key, default_value)
+
+
+@st.fragment(run_every=FRAGMENT_REFRESH_SECONDS)
+def poll_run_status(run_state_key: str):
+    """
+    Show progress for a submitted run. Runs as a fragment so only this block reruns while
+    the job is in progress; the Jobs API is polled with exponential backoff between refreshes.
+    """
+    run_state = st.session_state[run_state_key]
     
-    elif param_type == 'decimal':
-        min_val = validation.get('min', None)
-        max_val = validation.get('max', None)
-        value = st.number_input(
-            label=f"{label}{' *' if required else ''}",
-            value=float(default_value) if default_value is not None else (min_val if min_val else 0.0),
-            min_value=min_val if min_val is not None else None,
-            max_value=max_val if max_val is not None else None,
-            step=0.01,
-            format="%.2f",
-            key=key
-        )
-        return value if value is not None else None
+    job_run_url = run_state['job_run_url']
     
-    elif param_type == 'date':
-        min_date_str = validation.get('min_date')
-        max_date_str = validation.get('max_date')
+    now = time.monotonic()
+    if now >= run_state['next_poll_at']:
+        run_state['next_poll_at'] = now + run_state['poll_interval']
+        run_state['poll_interval'] = min(run_state['poll_interval'] * 1.5, JOB_MAX_POLL_INTERVAL_SECONDS)
+        try:
+            completion_status = get_jobs_service().get_run_status(run_state['run_id'])
+        except Exception as e:
+            st.error(f"Error checking job status: {str(e)}")
+            return
         
-        min_date = None
-        max_date = None
+        run_state['life_cycle_state'] = completion_status['life_cycle_state']
+        if completion_status['status'] == 'RUNNING' and now - run_state['submitted_at'] >= JOB_TIMEOUT_SECONDS:
+            completion_status = {
+                "status": "TIMEOUT",
+                "state_message": f"Job did not complete within {JOB_TIMEOUT_SECONDS} seconds",
+                "life_cycle_state": completion_status['life_cycle_state'],
+                "result_state": None,
+                "task_errors": []
+            }
         
-        if min_date_str:
-            min_date = datetime.strptime(min_date_str, '%Y-%m-%d').date()
-        if max_date_str:
-            max_date = datetime.strptime(max_date_str, '%Y-%m-%d').date()
+        if completion_status['status'] != 'RUNNING':
+            # Rerun the whole page to render the final result and stop polling
+            run_state['completion_status'] = completion_status
+            st.rerun()
+    
+    st.info(f"Job submitted! Run ID: {run_state['run_id']}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
+    if run_state['life_cycle_state']:
+        st.text(f"Job status: {run_state['life_cycle_state']}")
+
+
+def render_run_result(run_state: Dict[str, Any]):
+    """Render the final result of a completed run."""
+    completion_status = run_state['completion_status']
+    run_id = run_state['run_id']
+    
+    job_run_url = run_state['job_run_url']
+    
+    if completion_status['status'] == 'SUCCESS':
+        st.success(f"✅ Job completed successfully!")
+        st.info(f"Run ID: {run_id}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
+    elif completion_status['status'] == 'FAILED':
+        st.error(f"❌ Job failed!")
         
-        default_date = None
-        if default_value:
-            if isinstance(default_value, str):
-                default_date = datetime.strptime(default_value, '%Y-%m-%d').date()
-            elif isinstance(default_value, date):
-                default_date = default_value
+        error_message = f"Run ID: {run_id}"
+        if completion_status.get('state_message'):
+            error_message += f"\n\n**Error:** {completion_status['state_message']}"
+        if completion_status.get('result_state'):
+            error_message += f"\n**Result State:** {completion_status['result_state']}"
         
-        value = st.date_input(
-            label=f"{label}{' *' if required else ''}",
-            value=default_date,
-            min_value=min_date,
-            max_value=max_date,
-            key=key
-        )
-        return value if value else None
-    
-    elif param_type == 'enum':
-        options = param_config.get('options', [])
-        default_index = 0
-        if default_value and default_value in options:
-            default_index = options.index(default_value)
+        # Display task-level errors if available
+        task_errors = completion_status.get('task_errors', [])
+        if task_errors:
+            error_message += "\n\n**Task Errors:**"
+            for task_error in task_errors:
+                error_message += f"\n- **Task:** {task_error.get('task_key', 'unknown')}"
+                if task_error.get('state_message'):
+                    error_message += f"\n  - {task_error['state_message']}"
+                if task_error.get('result_state'):
+                    error_message += f"\n  - State: {task_error['result_state']}"
         
-        value = st.selectbox(
-            label=f"{label}{' *' if required else ''}",
-            options=options,
-            index=default_index if default_value else 0,
-            key=key
-        )
-        return value if value else None
-    
+        error_message += f"\n\n🔗 [View Job Run in Databricks]({job_run_url})"
+        st.error(error_message)
+    elif completion_status['status'] == 'TIMEOUT':
+        st.warning(f"⏱️ Job did not complete within the timeout period")
+        st.info(f"Run ID: {run_id}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
     else:
-        # Fallback to text input
-        return st.text_input(
-            label=f"{label}{' *' if required else ''}",
-            value=default_value if default_value else "",
-            key=key
-        )
+        st.warning(f"⚠️ Job status: {completion_status['status']}")
+        st.info(f"Run ID: {run_id}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
 
 
 def render_job_form(config: Dict[str, Any]):
@@ -229,16 +413,10 @@ def render_job_form(config: Dict[str, Any]):
     description = config.get('description', '')
     parameters = config.get('parameters', [])
     
-    # Track if validation should be shown (only after submit attempt)
-    validation_key = f"show_validation_{job_name}"
-    show_validation = st.session_state.get(validation_key, False)
-    
-    # Back button
+    # Back button (outside the form so it works without submitting)
     if st.button("← Back to Job Selection", use_container_width=False):
         if "selected_job" in st.session_state:
             del st.session_state["selected_job"]
-        if validation_key in st.session_state:
-            del st.session_state[validation_key]
         st.rerun()
     
     st.title(display_name)
@@ -249,47 +427,50 @@ def render_job_form(config: Dict[str, Any]):
     
     # Store form values
     form_values = {}
-    validation_errors = {}
+    key_prefix = f"job_{job_name}"
     
-    # Render all parameter inputs
-    for param_config in parameters:
-        param_name = param_config['name']
-        value = render_parameter_input(param_config, f"job_{job_name}")
-        form_values[param_name] = value
-        
-        # Only validate if we should show validation errors
-        if show_validation:
-            is_valid, error_msg = validate_parameter(value, param_config)
-            if not is_valid:
-                validation_errors[param_name] = error_msg
+    # Only one run per job is tracked, so submitting is blocked until the current run finishes;
+    # the polling fragment triggers a full rerun on completion, which re-enables the button
+    run_state_key = f"active_run_{job_name}"
+    active_run = st.session_state.get(run_state_key)
+    run_in_progress = bool(active_run) and not active_run['completion_status']
     
-    # Display validation errors only if validation should be shown
-    if show_validation and validation_errors:
-        st.error("Please fix the following errors:")
-        for param_name, error_msg in validation_errors.items():
-            st.error(f"• {error_msg}")
-    
-    st.divider()
+    # Render all parameter inputs inside a form so editing them doesn't rerun the app until submit
+    with st.form(f"form_{job_name}", border=False):
+        for param_config in parameters:
+            param_name = param_config['name']
+            form_values[param_name] = render_parameter_input(param_config, key_prefix)
+        
+        st.divider()
+        
+        # Submit button
+        submitted = st.form_submit_button(
+            "🚀 Run Job", type="primary", use_container_width=True, disabled=run_in_progress
+        )
     
-    # Submit button
-    if st.button("🚀 Run Job", type="primary", use_container_width=True):
-        # Validate all fields when submit is clicked
+    if submitted and run_in_progress:
+        st.warning("This job is still running. Wait for it to finish before submitting again.")
+    elif submitted:
+        # Validate all fields and prepare job parameters (dates as strings) in a single pass
         validation_errors = {}
+        job_parameters = {}
         for param_config in parameters:
             param_name = param_config['name']
             value = form_values.get(param_name)
             is_valid, error_msg = validate_parameter(value, param_config)
             if not is_valid:
                 validation_errors[param_name] = error_msg
-        
-        # Set flag to show validation errors
-        st.session_state[validation_key] = True
+            elif value is not None:
+                job_parameters[param_name] = value.strftime('%Y-%m-%d') if isinstance(value, date) else str(value)
         
         if validation_errors:
-            st.error("Please fix validation errors before submitting.")
-            st.rerun()
+            st.error("Please fix the following errors:")
+            for param_name, error_msg in validation_errors.items():
+                st.error(f"• {error_msg}")
         else:
             try:
+                jobs_service = get_jobs_service()
+                
                 # Lookup job ID
                 with st.spinner("Looking up job ID..."):
                     job_id = jobs_service.get_job_id_by_name(job_name)
@@ -297,92 +478,39 @@ def render_job_form(config: Dict[str, Any]):
                 if not job_id:
                     st.error(f"Job '{job_name}' not found in Databricks workspace.")
                 else:
-                    # Prepare job parameters (convert dates to strings)
-                    job_parameters = {}
-                    for param_name, value in form_values.items():
-                        if value is not None:
-                            if isinstance(value, date):
-                                job_parameters[param_name] = value.strftime('%Y-%m-%d')
-                            else:
-                                job_parameters[param_name] = str(value)
-                    
                     # Submit job
                     with st.spinner(f"Submitting job '{display_name}'..."):
                         run_info = jobs_service.run_job(job_id, job_parameters)
                     
-                    # Construct Databricks job run URL
-                    databricks_host = os.getenv("DATABRICKS_HOST", "").rstrip('/')
-                    job_run_url = f"{databricks_host}/#job/{job_id}/run/{run_info['run_id']}"
+                    # Track the run in session state so the polling fragment survives reruns
+                    st.session_state[run_state_key] = {
+                        "job_id": job_id,
+                        "run_id": run_info['run_id'],
+                        "job_run_url": build_job_run_url(job_id, run_info['run_id']),
+                        "submitted_at": time.monotonic(),
+                        "next_poll_at": 0.0,
+                        "poll_interval": JOB_POLL_INTERVAL_SECONDS,
+                        "life_cycle_state": None,
+                        "completion_status": None
+                    }
                     
-                    # Poll for job completion
-                    status_container = st.empty()
-                    progress_text = st.empty()
-                    
-                    def update_progress(message: str):
-                        progress_text.text(message)
-                    
-                    with status_container.container():
-                        st.info(f"Job submitted! Run ID: {run_info['run_id']}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
-                    
-                    # Wait for job completion
-                    with st.spinner("Waiting for job to complete..."):
-                        completion_status = jobs_service.wait_for_job_completion(
-                            run_id=run_info['run_id'],
-                            timeout_seconds=3600,
-                            poll_interval=5,
-                            progress_callback=update_progress
-                        )
-                    
-                    # Clear progress text
-                    progress_text.empty()
-                    
-                    # Display final result
-                    if completion_status['status'] == 'SUCCESS':
-                        st.success(f"✅ Job completed successfully!")
-                        status_container.empty()
-                        st.info(f"Run ID: {run_info['run_id']}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
-                    elif completion_status['status'] == 'FAILED':
-                        st.error(f"❌ Job failed!")
-                        status_container.empty()
-                        
-                        error_message = f"Run ID: {run_info['run_id']}"
-                        if completion_status.get('state_message'):
-                            error_message += f"\n\n**Error:** {completion_status['state_message']}"
-                        if completion_status.get('result_state'):
-                            error_message += f"\n**Result State:** {completion_status['result_state']}"
-                        
-                        # Display task-level errors if available
-                        task_errors = completion_status.get('task_errors', [])
-                        if task_errors:
-                            error_message += "\n\n**Task Errors:**"
-                            for task_error in task_errors:
-                                error_message += f"\n- **Task:** {task_error.get('task_key', 'unknown')}"
-                                if task_error.get('state_message'):
-                                    error_message += f"\n  - {task_error['state_message']}"
-                                if task_error.get('result_state'):
-                                    error_message += f"\n  - State: {task_error['result_state']}"
-                        
-                        error_message += f"\n\n🔗 [View Job Run in Databricks]({job_run_url})"
-                        st.error(error_message)
-                    elif completion_status['status'] == 'TIMEOUT':
-                        st.warning(f"⏱️ Job did not complete within the timeout period")
-                        status_container.empty()
-                        st.info(f"Run ID: {run_info['run_id']}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
-                    else:
-                        st.warning(f"⚠️ Job status: {completion_status['status']}")
-                        status_container.empty()
-                        st.info(f"Run ID: {run_info['run_id']}\n\n🔗 [View Job Run in Databricks]({job_run_url})")
-                    
-                    # Clear form values and validation flag
-                    for param_config in parameters:
-                        param_name = param_config['name']
-                        key = f"job_{job_name}_{param_name}"
-                        if key in st.session_state:
-                            del st.session_state[key]
-                    if validation_key in st.session_state:
-                        del st.session_state[validation_key]
+                    # Clear form values
+                    for param_name in form_values:
+                        st.session_state.pop(f"{key_prefix}_{param_name}", None)
             except Exception as e:
                 st.error(f"Error submitting job: {str(e)}")
+            
+            # Rerun so the form is redrawn with the submit button disabled for the new run
+            if st.session_state.get(run_state_key) is not active_run:
+                st.rerun()
+    
+    # Show the latest run for this job: poll it while it runs, then show the final result
+    run_state = st.session_state.get(run_state_key)
+    if run_state:
+        if run_state['completion_status']:
+            render_run_result(run_state)
+        else:
+            poll_run_status(run_state_key)
 
 
 def main():
@@ -412,8 +540,8 @@ def main():
                 selected_job = str(job_param) if job_param else None
     
     if selected_job:
-        # Load and render specific job
-        config = load_job_config(selected_job)
+        # Render specific job
+        config = available_configs.get(selected_job)
         if config:
             render_job_form(config)
         else:
@@ -435,8 +563,8 @@ def main():
         )
         
         if selected_job_name:
-            # Load and display job config preview
-            config = load_job_config(selected_job_name)
+            # Display job config preview
+            config = available_configs.get(selected_job_name)
             if config:
                 st.divider()
                 st.markdown(f"### {config.get('display_name', selected_job_name)}")
@@ -1,66 +1,140 @@
+import asyncio
 import os
+import random
+import re
+import threading
 import time
+from datetime import timedelta
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
+from databricks.sdk.errors import OperationFailed
 from databricks.sdk.service.jobs import RunLifeCycleState, RunResultState
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+# DAB target from the environment (defaults to 'dev'); it doesn't change for the life of the process
+_DATABRICKS_BUNDLE_TARGET = os.getenv("DATABRICKS_BUNDLE_TARGET", "dev")
+
+# HTTP connections kept open to the workspace (the SDK default is 20); raise it when many runs
+# are monitored concurrently so status polls don't queue for a free connection
+_DATABRICKS_HTTP_POOL_SIZE = int(os.getenv("DATABRICKS_HTTP_POOL_SIZE", "32"))
+
+# DAB-deployed job names look like '[target user] job-name'; group 2 is the base job name.
+# The greedy first group splits at the last '] ', so nested prefixes keep their base name
+_DAB_NAME_RE = re.compile(r'^(.*)\] (.*)$', re.DOTALL)
+
+# Life cycle states after which a run will not change any more
+_TERMINAL_LIFE_CYCLE_STATES = frozenset({
+    RunLifeCycleState.TERMINATED,
+    RunLifeCycleState.SKIPPED,
+    RunLifeCycleState.INTERNAL_ERROR
+})
+
+
+def _task_error(task) -> Optional[Dict[str, Any]]:
+    """Describe a task that did not succeed, or return None if it succeeded or has no result."""
+    task_state = getattr(task, 'state', None)
+    task_result_state = getattr(task_state, 'result_state', None) if task_state else None
+    if not task_result_state or task_result_state == RunResultState.SUCCESS:
+        return None
+    return {
+        "task_key": getattr(task, 'task_key', 'unknown'),
+        "state_message": getattr(task_state, 'state_message', None),
+        "result_state": task_result_state.value if hasattr(task_result_state, 'value') else str(task_result_state)
+    }
 
 
 class DatabricksJobsService:
-    """Singleton service for interacting with Databricks Jobs API."""
+    """
+    Service for interacting with Databricks Jobs API.
+    Use the shared module-level `jobs_service` instance rather than constructing new ones.
+    """
+    
+    # How long a resolved job name -> job ID mapping is reused before re-listing jobs
+    JOB_ID_CACHE_TTL_SECONDS = 300
+    # How long a "not found" result is reused; short so freshly deployed jobs are picked up quickly
+    JOB_ID_NEGATIVE_CACHE_TTL_SECONDS = 10
+    # How long the full workspace jobs listing is reused for fallback name matching
+    JOBS_LIST_CACHE_TTL_SECONDS = 60
+    # Largest page size the Jobs List API accepts (its default is 20)
+    JOBS_LIST_PAGE_SIZE = 100
     
-    _instance = None
-    _workspace_client = None
-    _current_user = None
-    _dab_target = None
+    def __init__(self):
+        self._workspace_client: Optional[WorkspaceClient] = None
+        self._current_user: Optional[str] = None
+        self._dab_prefix: Optional[str] = None
+        # Guard lazy initialisation so concurrent first calls don't build two clients
+        self._client_lock = threading.Lock()
+        self._user_lock = threading.Lock()
+        # Job IDs are kept as the SDK's ints internally and only turned into strings for callers
+        self._job_id_cache: Dict[str, Tuple[float, Optional[int]]] = {}
+        self._jobs_by_name: Dict[str, int] = {}
+        self._jobs_by_suffix: Dict[str, List[Tuple[str, int]]] = {}
+        self._jobs_cache_ts: Optional[float] = None
+        self._jobs_cache_lock = threading.Lock()
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(DatabricksJobsService, cls).__new__(cls)
-        return cls._instance
+    def _reset_after_fork(self):
+        """
+        Drop state that must not be shared with a forked child process: the WorkspaceClient's
+        pooled connections belong to the parent, and a lock held by another thread at fork time
+        would never be released. Cached names and job listings are plain data and stay valid.
+        """
+        self._workspace_client = None
+        self._client_lock = threading.Lock()
+        self._user_lock = threading.Lock()
+        self._jobs_cache_lock = threading.Lock()
     
     def _get_workspace_client(self) -> WorkspaceClient:
         """Get or create WorkspaceClient instance."""
         if self._workspace_client is None:
-            self._workspace_client = WorkspaceClient(
-                host=os.getenv("DATABRICKS_HOST"),
-                client_id=os.getenv("DATABRICKS_CLIENT_ID"),
-                client_secret=os.getenv("DATABRICKS_CLIENT_SECRET")
-            )
+            with self._client_lock:
+                if self._workspace_client is None:
+                    # The pool settings are only accepted through Config, not WorkspaceClient's own arguments
+                    self._workspace_client = WorkspaceClient(config=Config(
+                        host=os.getenv("DATABRICKS_HOST"),
+                        client_id=os.getenv("DATABRICKS_CLIENT_ID"),
+                        client_secret=os.getenv("DATABRICKS_CLIENT_SECRET"),
+                        max_connection_pools=_DATABRICKS_HTTP_POOL_SIZE,
+                        max_connections_per_pool=_DATABRICKS_HTTP_POOL_SIZE
+                    ))
         return self._workspace_client
     
     def _get_current_user(self) -> Optional[str]:
         """Get the current Databricks user name."""
         if self._current_user is None:
-            try:
-                w = self._get_workspace_client()
-                current_user = w.current_user.me()
-                # Extract username from user object (could be user_name or user_name property)
-                if hasattr(current_user, 'user_name'):
-                    self._current_user = current_user.user_name
-                elif hasattr(current_user, 'userName'):
-                    self._current_user = current_user.userName
-                else:
-                    # Fallback: try to get from the string representation
-                    self._current_user = str(current_user)
-            except Exception as e:
-                # If we can't get the user, return None and fall back to pattern matching
-                return None
+            with self._user_lock:
+                # A user name from the environment skips the current_user.me() API call.
+                # Not DATABRICKS_USERNAME: the SDK reads that for basic auth, which clashes with OAuth
+                env_user = os.getenv("DATABRICKS_BUNDLE_USER")
+                if self._current_user is None and env_user:
+                    self._current_user = env_user
+                if self._current_user is None:
+                    try:
+                        w = self._get_workspace_client()
+                        current_user = w.current_user.me()
+                        # Extract username from user object (could be user_name or user_name property)
+                        if hasattr(current_user, 'user_name'):
+                            self._current_user = current_user.user_name
+                        elif hasattr(current_user, 'userName'):
+                            self._current_user = current_user.userName
+                        else:
+                            # Fallback: try to get from the string representation
+                            self._current_user = str(current_user)
+                    except Exception as e:
+                        # If we can't get the user, return None and fall back to pattern matching
+                        return None
         return self._current_user
     
     def _get_dab_target(self) -> str:
         """Get the DAB target (defaults to 'dev')."""
-        if self._dab_target is None:
-            # Check environment variable first, then default to 'dev'
-            self._dab_target = os.getenv("DATABRICKS_BUNDLE_TARGET", "dev")
-        return self._dab_target
+        return _DATABRICKS_BUNDLE_TARGET
     
     def _get_dab_prefix(self) -> Optional[str]:
         """Construct the DAB prefix pattern: '[target user]'."""
-        target = self._get_dab_target()
-        user = self._get_current_user()
-        if user:
-            return f"[{target} {user}]"
-        return None
+        if self._dab_prefix is None:
+            user = self._get_current_user()
+            if user:
+                self._dab_prefix = f"[{self._get_dab_target()} {user}]"
+        return self._dab_prefix
     
     def get_job_id_by_name(self, job_name: str) -> Optional[str]:
         """
@@ -68,65 +142,171 @@ class DatabricksJobsService:
         Handles both exact matches and Databricks Asset Bundle (DAB) prefixed names.
         DAB adds prefixes like '[dev james_graham] job-name', so we match jobs for the current user.
         Prioritizes DAB-prefixed jobs over exact matches to ensure we use the deployed bundle version.
+        Resolved IDs are cached for JOB_ID_CACHE_TTL_SECONDS to avoid re-listing jobs on every submit,
+        and "not found" results for JOB_ID_NEGATIVE_CACHE_TTL_SECONDS.
         Returns the job ID if found, None otherwise.
         """
-        try:
-            w = self._get_workspace_client()
-            jobs = list(w.jobs.list())
-            
-            # Get the expected DAB prefix for the current user
-            dab_prefix = self._get_dab_prefix()
-            expected_full_name = f"{dab_prefix} {job_name}" if dab_prefix else None
+        return self.get_job_ids_by_names([job_name])[job_name]
+    
+    def get_job_ids_by_names(self, job_names: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Lookup job IDs for several job names at once, using the same matching rules and
+        caching as get_job_id_by_name. All uncached names share a single jobs listing.
+        Returns a dict mapping each job name to its job ID, or None if not found.
+        """
+        results: Dict[str, Optional[int]] = {}
+        pending = []
+        now = time.monotonic()
+        for job_name in job_names:
+            cached = self._job_id_cache.get(job_name)
+            if cached:
+                cached_at, job_id = cached
+                ttl = self.JOB_ID_CACHE_TTL_SECONDS if job_id else self.JOB_ID_NEGATIVE_CACHE_TTL_SECONDS
+                if now - cached_at < ttl:
+                    results[job_name] = job_id
+                    continue
+            pending.append(job_name)
+        
+        if pending:
+            try:
+                found = self._find_job_ids(pending)
+            except Exception as e:
+                raise Exception(f"Error looking up job '{', '.join(pending)}': {str(e)}")
             
+            # Misses are cached too, but expire after JOB_ID_NEGATIVE_CACHE_TTL_SECONDS
+            now = time.monotonic()
+            for job_name, job_id in found.items():
+                self._job_id_cache[job_name] = (now, job_id)
+            results.update(found)
+        
+        return {job_name: str(job_id) if job_id else None for job_name, job_id in results.items()}
+    
+    def _forget_job_id(self, job_id: int):
+        """Drop cached name lookups that resolved to the given job ID."""
+        for job_name, (_, cached_id) in list(self._job_id_cache.items()):
+            if cached_id == job_id:
+                self._job_id_cache.pop(job_name, None)
+    
+    def _list_jobs_cached(
+        self,
+        max_age_seconds: Optional[float] = None
+    ) -> Tuple[Dict[str, int], Dict[str, List[Tuple[str, int]]]]:
+        """
+        Return two indexes over the workspace's jobs: job name -> job ID, and DAB base name ->
+        (full job name, job ID) pairs in listing order, for names of the form '[target user] base-name'.
+        The listing is refreshed once it is older than max_age_seconds (default
+        JOBS_LIST_CACHE_TTL_SECONDS); the lock makes concurrent callers wait for a single refresh
+        instead of each paging through the API.
+        """
+        if max_age_seconds is None:
+            max_age_seconds = self.JOBS_LIST_CACHE_TTL_SECONDS
+        with self._jobs_cache_lock:
+            now = time.monotonic()
+            if self._jobs_cache_ts is None or now - self._jobs_cache_ts >= max_age_seconds:
+                jobs_by_name: Dict[str, int] = {}
+                jobs_by_suffix: Dict[str, List[Tuple[str, int]]] = {}
+                # Stream the pages instead of materialising every BaseJob; only names and IDs are kept.
+                # Request the API's maximum page size so a full listing takes 5x fewer round trips
+                for job in self._get_workspace_client().jobs.list(limit=self.JOBS_LIST_PAGE_SIZE):
+                    settings = job.settings
+                    name = settings.name if settings else None
+                    if not name:
+                        continue
+                    job_id = job.job_id
+                    # Keep the first job listed for a name, matching the previous linear scan
+                    if name not in jobs_by_name:
+                        jobs_by_name[name] = job_id
+                    # Index DAB-deployed jobs by the name that follows their '[target user] ' prefix
+                    # Matches exactly the names an endswith('] job-name') check would, nested prefixes included
+                    dab_match = _DAB_NAME_RE.match(name)
+                    if dab_match:
+                        jobs_by_suffix.setdefault(dab_match.group(2), []).append((name, job_id))
+                self._jobs_by_name = jobs_by_name
+                self._jobs_by_suffix = jobs_by_suffix
+                self._jobs_cache_ts = now
+            return self._jobs_by_name, self._jobs_by_suffix
+    
+    def invalidate_jobs_cache(self):
+        """Forget cached job listings and name lookups, e.g. right after deploying a bundle."""
+        with self._jobs_cache_lock:
+            self._jobs_by_name = {}
+            self._jobs_by_suffix = {}
+            self._jobs_cache_ts = None
+        self._job_id_cache.clear()
+    
+    def _find_job_ids(self, job_names: List[str]) -> Dict[str, Optional[int]]:
+        """Find the best match for each job name in the workspace jobs list."""
+        # Get the expected DAB prefix for the current user
+        dab_prefix = self._get_dab_prefix()
+        
+        # A single lookup is usually for the current user's DAB-deployed job, so try the
+        # server-side name filter (case-insensitive) first; it is one small request
+        if len(job_names) == 1 and dab_prefix:
+            job_name = job_names[0]
+            expected_full_name = f"{dab_prefix} {job_name}"
+            for job in self._get_workspace_client().jobs.list(name=expected_full_name):
+                if job.settings and job.settings.name == expected_full_name:
+                    return {job_name: job.job_id}
+        
+        # Everything else needs to see every job name, so share one (cached) full listing
+        results = self._match_listed_jobs(job_names, dab_prefix, *self._list_jobs_cached())
+        
+        # A miss may just be a job deployed after the listing was cached. Re-check misses against a
+        # listing no older than JOB_ID_NEGATIVE_CACHE_TTL_SECONDS, so "not found" is no staler than that
+        missing = [job_name for job_name, job_id in results.items() if not job_id]
+        if missing:
+            jobs_by_name, jobs_by_suffix = self._list_jobs_cached(
+                max_age_seconds=self.JOB_ID_NEGATIVE_CACHE_TTL_SECONDS
+            )
+            results.update(self._match_listed_jobs(missing, dab_prefix, jobs_by_name, jobs_by_suffix))
+        return results
+    
+    def _match_listed_jobs(
+        self,
+        job_names: List[str],
+        dab_prefix: Optional[str],
+        jobs_by_name: Dict[str, int],
+        jobs_by_suffix: Dict[str, List[Tuple[str, int]]]
+    ) -> Dict[str, Optional[int]]:
+        """Pick the best match for each job name from the cached jobs-list indexes."""
+        results: Dict[str, Optional[int]] = {}
+        for job_name in job_names:
             # PRIORITY 1: Try to match jobs with the current user's DAB prefix first
             # This ensures we use the DAB-deployed version when available
-            if expected_full_name:
-                for job in jobs:
-                    if job.settings and job.settings.name == expected_full_name:
-                        return str(job.job_id)
+            job_id = jobs_by_name.get(f"{dab_prefix} {job_name}") if dab_prefix else None
             
-            # PRIORITY 2: Match any job ending with the expected name that has a DAB prefix
+            # PRIORITY 2: Match any job with a DAB prefix and the expected base name
             # This handles cases where we can't determine the current user but can still find DAB jobs
-            # We prefer ANY DAB-prefixed job over exact matches
-            dab_prefixed_jobs = []
-            for job in jobs:
-                if job.settings and job.settings.name:
-                    job_name_full = job.settings.name
-                    # Match if job name ends with the expected name and has a DAB prefix format
-                    # DAB format: '[target user] job-name'
-                    if job_name_full.endswith(f"] {job_name}"):
-                        # If we have a prefix, prioritize jobs matching our prefix
-                        if dab_prefix and job_name_full.startswith(dab_prefix):
-                            return str(job.job_id)
-                        # Otherwise, collect all DAB-prefixed jobs
-                        else:
-                            dab_prefixed_jobs.append(job)
-            
-            # If we found any DAB-prefixed jobs (even if not matching our user), prefer them
-            if dab_prefixed_jobs:
-                # Return the first one found (could be enhanced to prefer current user if detectable)
-                return str(dab_prefixed_jobs[0].job_id)
+            # We prefer ANY DAB-prefixed job over exact matches, and our own prefix over other users'
+            if not job_id:
+                dab_jobs = jobs_by_suffix.get(job_name)
+                if dab_jobs:
+                    job_id = next(
+                        (dab_job_id for name, dab_job_id in dab_jobs if dab_prefix and name.startswith(dab_prefix)),
+                        dab_jobs[0][1]
+                    )
             
             # PRIORITY 3: Fallback to exact match (for backward compatibility)
             # Only used if no DAB-prefixed version is found
-            for job in jobs:
-                if job.settings and job.settings.name == job_name:
-                    return str(job.job_id)
-            
-            return None
-        except Exception as e:
-            raise Exception(f"Error looking up job '{job_name}': {str(e)}")
+            results[job_name] = job_id or jobs_by_name.get(job_name)
+        return results
     
     def run_job(self, job_id: str, job_parameters: dict) -> dict:
         """
         Trigger a Databricks job run with parameters.
         Returns the run information.
         """
+        job_id_int = None
         try:
+            # job_id must be an int according to the SDK; convert once so a bad ID fails before any API call
+            job_id_int = int(job_id)
             w = self._get_workspace_client()
+            # Only send job_parameters when there are some; the job's defaults apply otherwise
+            run_kwargs: Dict[str, Any] = {"job_id": job_id_int}
+            if job_parameters:
+                run_kwargs["job_parameters"] = job_parameters
             # run_now returns a Wait[Run] object, access the actual Run via .response
-            # job_id must be an int according to the SDK
-            run_response = w.jobs.run_now(job_id=int(job_id), job_parameters=job_parameters)
+            run_response = w.jobs.run_now(**run_kwargs)
             run = run_response.response
             
             result = {
@@ -137,22 +317,28 @@ class DatabricksJobsService:
                 result["number_in_job"] = run.number_in_job
             return result
         except Exception as e:
+            # The cached name lookup may point at a job that was deleted or redeployed
+            if job_id_int is not None:
+                self._forget_job_id(job_id_int)
             raise Exception(f"Error running job '{job_id}': {str(e)}")
     
     def wait_for_job_completion(
         self, 
         run_id: str, 
         timeout_seconds: int = 3600,
-        poll_interval: int = 5,
+        poll_interval: Optional[float] = None,
+        max_poll_interval: Optional[float] = None,
         progress_callback: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
-        Poll for job completion and return the final status.
+        Wait for job completion and return the final status.
+        Uses the SDK's wait_get_run_job_terminated_or_skipped, which polls with its own backoff.
         
         Args:
             run_id: The run ID to monitor
             timeout_seconds: Maximum time to wait (default: 1 hour)
-            poll_interval: Seconds between status checks (default: 5)
+            poll_interval: Ignored; accepted for existing callers, the SDK waiter sets the poll schedule
+            max_poll_interval: Ignored; accepted for existing callers, the SDK waiter sets the poll schedule
             progress_callback: Optional callback function to report progress updates
         
         Returns:
@@ -163,74 +349,196 @@ class DatabricksJobsService:
                 - result_state: Final result state
         """
         try:
+            # Convert once up front so a bad run ID fails before any API call
+            run_id_int = int(run_id)
             w = self._get_workspace_client()
-            start_time = time.time()
+            last_run = None
             
-            while True:
-                # Get current run status
-                run_info = w.jobs.get_run(run_id=int(run_id))
-                state = run_info.state
-                life_cycle_state = state.life_cycle_state
-                
+            def on_poll(run):
+                nonlocal last_run
+                last_run = run
                 # Report progress if callback provided
                 if progress_callback:
-                    progress_callback(f"Job status: {life_cycle_state.value}")
-                
-                # Check if job has reached a terminal state
-                if life_cycle_state in [
-                    RunLifeCycleState.TERMINATED,
-                    RunLifeCycleState.SKIPPED,
-                    RunLifeCycleState.INTERNAL_ERROR
-                ]:
-                    result_state = state.result_state
-                    state_message = getattr(state, 'state_message', None)
-                    
-                    if result_state == RunResultState.SUCCESS:
-                        return {
-                            "status": "SUCCESS",
-                            "state_message": None,
-                            "life_cycle_state": life_cycle_state.value,
-                            "result_state": result_state.value,
-                            "task_errors": []
-                        }
-                    else:
-                        # Collect task-level errors
-                        task_errors = []
-                        if hasattr(run_info, 'tasks') and run_info.tasks:
-                            for task in run_info.tasks:
-                                if hasattr(task, 'state') and task.state:
-                                    task_state = task.state
-                                    task_result_state = getattr(task_state, 'result_state', None)
-                                    if task_result_state and task_result_state != RunResultState.SUCCESS:
-                                        task_error = {
-                                            "task_key": getattr(task, 'task_key', 'unknown'),
-                                            "state_message": getattr(task_state, 'state_message', None),
-                                            "result_state": task_result_state.value if hasattr(task_result_state, 'value') else str(task_result_state)
-                                        }
-                                        task_errors.append(task_error)
-                        
-                        return {
-                            "status": "FAILED",
-                            "state_message": state_message,
-                            "life_cycle_state": life_cycle_state.value,
-                            "result_state": result_state.value if result_state else None,
-                            "task_errors": task_errors
-                        }
-                
-                # Check for timeout
-                elapsed_time = time.time() - start_time
-                if elapsed_time > timeout_seconds:
-                    return {
-                        "status": "TIMEOUT",
-                        "state_message": f"Job did not complete within {timeout_seconds} seconds",
-                        "life_cycle_state": life_cycle_state.value,
-                        "result_state": None,
-                        "task_errors": []
-                    }
-                
-                # Wait before polling again
-                time.sleep(poll_interval)
-                
+                    progress_callback(f"Job status: {run.state.life_cycle_state.value}")
+            
+            try:
+                run_info = w.jobs.wait_get_run_job_terminated_or_skipped(
+                    run_id=run_id_int,
+                    timeout=timedelta(seconds=timeout_seconds),
+                    callback=on_poll
+                )
+            except OperationFailed:
+                # The SDK raises on INTERNAL_ERROR; fetch the run to report its failure details
+                run_info = w.jobs.get_run(run_id=run_id_int)
+            except TimeoutError:
+                return {
+                    "status": "TIMEOUT",
+                    "state_message": f"Job did not complete within {timeout_seconds} seconds",
+                    "life_cycle_state": last_run.state.life_cycle_state.value if last_run else None,
+                    "result_state": None,
+                    "task_errors": []
+                }
+            
+            return self._build_completion_status(run_info)
         except Exception as e:
             raise Exception(f"Error waiting for job completion '{run_id}': {str(e)}")
+    
+    def get_run_status(self, run_id: str) -> Dict[str, Any]:
+        """
+        Check a run's status once without waiting.
+        Returns the same dictionary as wait_for_job_completion once the run is in a terminal
+        state, otherwise status 'RUNNING' with the current life_cycle_state.
+        """
+        try:
+            w = self._get_workspace_client()
+            # Status polls don't need repair history or resolved parameter values
+            run_info = w.jobs.get_run(run_id=int(run_id), include_history=False, include_resolved_values=False)
+            life_cycle_state = run_info.state.life_cycle_state
+            
+            if life_cycle_state in _TERMINAL_LIFE_CYCLE_STATES:
+                return self._build_completion_status(run_info)
+            
+            return {
+                "status": "RUNNING",
+                "state_message": None,
+                "life_cycle_state": life_cycle_state.value,
+                "result_state": None,
+                "task_errors": []
+            }
+        except Exception as e:
+            raise Exception(f"Error getting status for run '{run_id}': {str(e)}")
+    
+    async def wait_for_job_completion_async(
+        self,
+        run_id: str,
+        timeout_seconds: int = 3600,
+        poll_interval: float = 1,
+        max_poll_interval: float = 10,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of wait_for_job_completion, so many runs can be awaited on one event loop
+        (e.g. with asyncio.gather) instead of blocking a thread each.
+        Each status check runs get_run_status in a worker thread; between checks the wait starts
+        at poll_interval and grows 1.5x (plus a little jitter) up to max_poll_interval.
+        
+        Returns the same dictionary as wait_for_job_completion.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        interval = poll_interval
+        
+        while True:
+            status = await asyncio.to_thread(self.get_run_status, run_id)
+            if status["status"] != "RUNNING":
+                return status
+            
+            # Report progress if callback provided
+            if progress_callback:
+                progress_callback(f"Job status: {status['life_cycle_state']}")
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return {
+                    "status": "TIMEOUT",
+                    "state_message": f"Job did not complete within {timeout_seconds} seconds",
+                    "life_cycle_state": status["life_cycle_state"],
+                    "result_state": None,
+                    "task_errors": []
+                }
+            
+            await asyncio.sleep(min(interval + random.uniform(0, 0.25), remaining))
+            interval = min(interval * 1.5, max_poll_interval)
+    
+    async def run_jobs_and_wait(
+        self,
+        jobs: List[Tuple[str, Dict[str, str]]],
+        timeout_seconds: int = 3600
+    ) -> List[Dict[str, Any]]:
+        """
+        Trigger several jobs by name and wait for all of them concurrently.
+        
+        Args:
+            jobs: (job name, job parameters) pairs
+            timeout_seconds: Maximum time to wait for each run (default: 1 hour)
+        
+        Returns:
+            One dictionary per job, in the order given, with:
+                - job_name: The job name
+                - run_id: The triggered run's ID, or None if the run could not be started
+                - completion: The wait_for_job_completion dictionary, or None on error
+                - error: Error message if triggering or waiting failed, None otherwise
+        """
+        # Nothing has been triggered yet, so an unknown name can still fail the whole batch
+        job_ids = await asyncio.to_thread(self.get_job_ids_by_names, [job_name for job_name, _ in jobs])
+        missing = [job_name for job_name, _ in jobs if not job_ids[job_name]]
+        if missing:
+            raise Exception(f"Jobs not found in Databricks workspace: {', '.join(missing)}")
+        
+        # From here on runs may already be started, so failures are reported per job rather than
+        # raised; otherwise the run IDs of the jobs that did start would be lost
+        runs = await asyncio.gather(*(
+            asyncio.to_thread(self.run_job, job_ids[job_name], job_parameters)
+            for job_name, job_parameters in jobs
+        ), return_exceptions=True)
+        
+        results = []
+        started = []
+        for (job_name, _), run in zip(jobs, runs):
+            result = {"job_name": job_name, "run_id": None, "completion": None, "error": None}
+            if isinstance(run, BaseException):
+                result["error"] = str(run)
+            else:
+                result["run_id"] = run["run_id"]
+                started.append(result)
+            results.append(result)
+        
+        completions = await asyncio.gather(*(
+            self.wait_for_job_completion_async(result["run_id"], timeout_seconds=timeout_seconds)
+            for result in started
+        ), return_exceptions=True)
+        for result, completion in zip(started, completions):
+            if isinstance(completion, BaseException):
+                result["error"] = str(completion)
+            else:
+                result["completion"] = completion
+        return results
+    
+    def _build_completion_status(self, run_info) -> Dict[str, Any]:
+        """Build the completion status dictionary for a run in a terminal state."""
+        state = run_info.state
+        life_cycle_state = state.life_cycle_state
+        result_state = state.result_state
+        state_message = getattr(state, 'state_message', None)
+        
+        if result_state == RunResultState.SUCCESS:
+            return {
+                "status": "SUCCESS",
+                "state_message": None,
+                "life_cycle_state": life_cycle_state.value,
+                "result_state": result_state.value,
+                "task_errors": []
+            }
+        
+        # Collect task-level errors. A single-task run's failure is already described by the
+        # run-level state_message, so only look at tasks when there are several or no message
+        task_errors = []
+        tasks = getattr(run_info, 'tasks', None)
+        if tasks and (len(tasks) > 1 or not state_message):
+            task_errors = [error for error in map(_task_error, tasks) if error]
+        
+        return {
+            "status": "FAILED",
+            "state_message": state_message,
+            "life_cycle_state": life_cycle_state.value,
+            "result_state": result_state.value if result_state else None,
+            "task_errors": task_errors
+        }
+
+
+# Shared service instance, created once when the module is first imported
+jobs_service = DatabricksJobsService()
 
+# Give forked worker processes (e.g. multiprocessing) their own client and connection pool
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=jobs_service._reset_after_fork)